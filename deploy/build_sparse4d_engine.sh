@@ -5,6 +5,13 @@ if [ ! -d "${ENVTRTLOGSDIR}" ]; then
     mkdir -p "${ENVTRTLOGSDIR}"
 fi
 
+# head onnx has a dynamic batch axis, profile range is [1, ENV_HEAD_MAX_BATCH]
+MAXB=${ENV_HEAD_MAX_BATCH:-1}
+HEAD1_SHAPES="instance_feature:{B}x900x256,anchor:{B}x900x11,time_interval:{B},\
+feature:{B}x89760x256,lidar2img:{B}x6x4x4,image_wh:{B}x6x2"
+HEAD2_SHAPES="temp_instance_feature:{B}x600x256,temp_anchor:{B}x600x11,mask:{B},\
+track_id:{B}x900,${HEAD1_SHAPES}"
+
 echo "STEP1: build sparse4dbackbone engine -> saving in ${ENV_BACKBONE_ENGINE}..."
 # STEP1: build sparse4dbackbone engine
 ${ENV_TensorRT_BIN}/trtexec --onnx=${ENV_BACKBONE_ONNX} \
@@ -26,6 +33,9 @@ sleep 2s
 # STEP2: build 1st frame sparse4dhead engine
 ${ENV_TensorRT_BIN}/trtexec --onnx=${ENV_HEAD1_ONNX} \
     --plugins=$ENVTARGETPLUGIN \
+    --minShapes=${HEAD1_SHAPES//\{B\}/1} \
+    --optShapes=${HEAD1_SHAPES//\{B\}/1} \
+    --maxShapes=${HEAD1_SHAPES//\{B\}/${MAXB}} \
     --memPoolSize=workspace:2048 \
     --saveEngine=${ENV_HEAD1_ENGINE} \
     --verbose \
@@ -44,6 +54,9 @@ sleep 2s
 # STEP3: build frame > 2 sparse4dhead engine
 ${ENV_TensorRT_BIN}/trtexec --onnx=${ENV_HEAD2_ONNX} \
     --plugins=$ENVTARGETPLUGIN \
+    --minShapes=${HEAD2_SHAPES//\{B\}/1} \
+    --optShapes=${HEAD2_SHAPES//\{B\}/1} \
+    --maxShapes=${HEAD2_SHAPES//\{B\}/${MAXB}} \
     --memPoolSize=workspace:2048 \
     --saveEngine=${ENV_HEAD2_ENGINE} \
     --verbose \
@@ -19,6 +19,9 @@ from typing import Optional, Dict, Any
 
 from tool.utils.logger import set_logger
 
+# same logger configured by set_logger in __main__
+logger = logging.getLogger("logger_name")
+
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Deploy PerceptionE2E Head!")
@@ -76,12 +79,6 @@ class FisrtFrame_Sparse4DHead(nn.Module):
         temp_instance_feature = None
         temp_anchor_embed = None
 
-        # DAF inputs
-        metas = {
-            "lidar2img": lidar2img,
-            "image_wh": image_wh,
-        }
-
         anchor_embed = self.anchor_encoder(anchor)
 
         feature_maps = [feature, spatial_shapes, level_start_index]
@@ -89,7 +86,8 @@ class FisrtFrame_Sparse4DHead(nn.Module):
         # self.operation_order
         debug = ["deformable"]
         for i, op in enumerate(debug):
-            print("i: ", i, " op:  ", op)
+            if not torch.jit.is_tracing():
+                logger.debug(f"i: {i}\top: {op}")
             if self.layers[i] is None:
                 continue
             elif op == "temp_gnn":
@@ -116,7 +114,8 @@ class FisrtFrame_Sparse4DHead(nn.Module):
                     anchor,
                     anchor_embed,
                     feature_maps,
-                    metas,
+                    lidar2img,
+                    image_wh,
                 )
             elif op == "refine":
                 anchor, cls, qt = self.layers[i](
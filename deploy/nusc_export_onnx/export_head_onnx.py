@@ -1,7 +1,7 @@
 # Copyright (c) 2024 SparseEnd2End. All rights reserved @author: Thomas Von Wu.
 import os
 import time
-import copy
+import ctypes
 import logging
 import argparse
 
@@ -19,6 +19,29 @@ from typing import Optional, Dict, Any
 
 from tool.utils.logger import set_logger
 
+# same logger configured by set_logger in __main__
+logger = logging.getLogger("logger_name")
+
+# Only batch is dynamic. The camera axis stays static since
+# DeformableFeatureAggregation bakes num_cams into its weights and reshapes.
+HEAD1_DYNAMIC_AXES = {
+    "instance_feature": {0: "B"},
+    "anchor": {0: "B"},
+    "time_interval": {0: "B"},
+    "feature": {0: "B"},
+    "lidar2img": {0: "B"},
+    "image_wh": {0: "B"},
+    "class_score": {0: "B"},
+    "quality_score": {0: "B"},
+}
+HEAD2_DYNAMIC_AXES = {
+    "temp_instance_feature": {0: "B"},
+    "temp_anchor": {0: "B"},
+    "mask": {0: "B"},
+    "track_id": {0: "B"},
+    **HEAD1_DYNAMIC_AXES,
+}
+
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Deploy PerceptionE2E Head!")
@@ -52,18 +75,79 @@ def parse_args():
     parser.add_argument(
         "--osec", action="store_true", help="only export sparse4dhead2rd onnx."
     )
+    parser.add_argument(
+        "--ort_opt",
+        action="store_true",
+        help="additionally save onnxruntime extended-level optimized onnx as *_opt.onnx.",
+    )
+    parser.add_argument(
+        "--ort_custom_op",
+        type=str,
+        default=None,
+        help="onnxruntime custom op library implementing DeformableAttentionAggrPlugin.",
+    )
+    parser.add_argument(
+        "--trt_fp16",
+        action="store_true",
+        help="additionally build fp16 tensorrt engine for each exported onnx.",
+    )
+    parser.add_argument(
+        "--trt_max_batch",
+        type=int,
+        default=1,
+        help="max batch size of the tensorrt optimization profile.",
+    )
+    parser.add_argument(
+        "--trt_plugin",
+        type=str,
+        default="deploy/dfa_plugin/lib/deformableAttentionAggr.so",
+        help="deformable attention aggregation plugin needed by the head engine.",
+    )
     args = parser.parse_args()
+    # both head graphs contain custom::DeformableAttentionAggrPlugin
+    if args.ort_opt and args.ort_custom_op is None:
+        parser.error("--ort_opt requires --ort_custom_op")
     return args
 
 
+# ops consuming anchor_embed
+ANCHOR_EMBED_OPS = ("temp_gnn", "gnn", "deformable", "refine")
+
+
+def build_op_plan(head):
+    """Flatten head.operation_order into a static plan.
+
+    Return:
+        tuple of (layer_idx, op, is_last, reencode), empty layers are dropped so
+        the traced head_forward runs straight-line without per-step checks.
+        reencode marks a refine whose updated anchor is consumed by a later op,
+        so anchor_encoder only runs when its output is actually used.
+    """
+    ops = [
+        (i, op)
+        for i, op in enumerate(head.operation_order)
+        if head.layers[i] is not None
+    ]
+    last = len(head.operation_order) - 1
+    plan = []
+    for k, (i, op) in enumerate(ops):
+        reencode = op == "refine" and any(
+            later_op in ANCHOR_EMBED_OPS for _, later_op in ops[k + 1 :]
+        )
+        plan.append((i, op, i == last, reencode))
+    return tuple(plan)
+
+
 class Sparse4DHead1st(nn.Module):
     def __init__(self, model):
         super(Sparse4DHead1st, self).__init__()
         self.model = model
+        self.op_plan = build_op_plan(model.head)
 
     @staticmethod
     def head_forward(
         self,
+        op_plan,
         instance_feature,
         anchor,
         time_interval,
@@ -78,21 +162,14 @@ class Sparse4DHead1st(nn.Module):
         temp_instance_feature = None
         temp_anchor_embed = None
 
-        # DAF inputs
-        metas = {
-            "lidar2img": lidar2img,
-            "image_wh": image_wh,
-        }
-
         anchor_embed = self.anchor_encoder(anchor)
 
         feature_maps = [feature, spatial_shapes, level_start_index]
-        prediction = []
-        for i, op in enumerate(self.operation_order):
-            print("i: ", i, "\top: ", op)
-            if self.layers[i] is None:
-                continue
-            elif op == "temp_gnn":
+        num_pred = 0  # number of refined predictions so far
+        for i, op, is_last, reencode in op_plan:
+            if not torch.jit.is_tracing():
+                logger.debug(f"i: {i}\top: {op}")
+            if op == "temp_gnn":
                 instance_feature = self.graph_model(
                     i,
                     instance_feature,
@@ -116,7 +193,8 @@ class Sparse4DHead1st(nn.Module):
                     anchor,
                     anchor_embed,
                     feature_maps,
-                    metas,
+                    lidar2img,
+                    image_wh,
                 )
             elif op == "refine":
                 anchor, cls, qt = self.layers[i](
@@ -125,12 +203,11 @@ class Sparse4DHead1st(nn.Module):
                     anchor_embed,
                     time_interval=time_interval,
                     return_cls=(
-                        len(prediction) == self.num_single_frame_decoder - 1
-                        or i == len(self.operation_order) - 1
+                        num_pred == self.num_single_frame_decoder - 1 or is_last
                     ),
                 )
-                prediction.append(anchor)
-                if i != len(self.operation_order) - 1:
+                num_pred += 1
+                if reencode:
                     anchor_embed = self.anchor_encoder(anchor)
         return instance_feature, anchor, cls, qt
 
@@ -148,6 +225,7 @@ class Sparse4DHead1st(nn.Module):
         head = self.model.head
         instance_feature, anchor, cls, qt = self.head_forward(
             head,
+            self.op_plan,
             instance_feature,
             anchor,
             time_interval,
@@ -164,10 +242,12 @@ class Sparse4DHead2rd(nn.Module):
     def __init__(self, model):
         super(Sparse4DHead2rd, self).__init__()
         self.model = model
+        self.op_plan = build_op_plan(model.head)
 
     @staticmethod
     def head_forward(
         self,
+        op_plan,
         temp_instance_feature,
         temp_anchor,
         mask,
@@ -184,19 +264,12 @@ class Sparse4DHead2rd(nn.Module):
         anchor_embed = self.anchor_encoder(anchor)
         temp_anchor_embed = self.anchor_encoder(temp_anchor)
 
-        # DAF inputs
-        metas = {
-            "lidar2img": lidar2img,
-            "image_wh": image_wh,
-        }
-
         feature_maps = [feature, spatial_shapes, level_start_index]
-        prediction = []
-        for i, op in enumerate(self.operation_order):
-            print("op:  ", op)
-            if self.layers[i] is None:
-                continue
-            elif op == "temp_gnn":
+        num_pred = 0  # number of refined predictions so far
+        for i, op, is_last, reencode in op_plan:
+            if not torch.jit.is_tracing():
+                logger.debug(f"i: {i}\top: {op}")
+            if op == "temp_gnn":
                 instance_feature = self.graph_model(
                     i,
                     instance_feature,
@@ -220,7 +293,8 @@ class Sparse4DHead2rd(nn.Module):
                     anchor,
                     anchor_embed,
                     feature_maps,
-                    metas,
+                    lidar2img,
+                    image_wh,
                 )
             elif op == "refine":
                 anchor, cls, qt = self.layers[i](
@@ -229,14 +303,13 @@ class Sparse4DHead2rd(nn.Module):
                     anchor_embed,
                     time_interval=time_interval,
                     return_cls=(
-                        len(prediction) == self.num_single_frame_decoder - 1
-                        or i == len(self.operation_order) - 1
+                        num_pred == self.num_single_frame_decoder - 1 or is_last
                     ),
                 )
-                prediction.append(anchor)
+                num_pred += 1
 
                 # update in head refine
-                if len(prediction) == self.num_single_frame_decoder:
+                if num_pred == self.num_single_frame_decoder:
                     N = (
                         self.instance_bank.num_anchor
                         - self.instance_bank.num_temp_instances
@@ -249,19 +322,22 @@ class Sparse4DHead2rd(nn.Module):
                         [temp_instance_feature, selected_feature], dim=1
                     )
                     selected_anchor = torch.cat([temp_anchor, selected_anchor], dim=1)
-                    instance_feature = torch.where(
-                        mask[:, None, None], selected_feature, instance_feature
+                    # scalar gating per sample: exported as Sub/Mul/Add instead of
+                    # a (bs, 900, c) Expand of the bool mask.
+                    mask_f = mask.to(instance_feature.dtype)[:, None, None]
+                    instance_feature = instance_feature + mask_f * (
+                        selected_feature - instance_feature
                     )
-                    anchor = torch.where(mask[:, None, None], selected_anchor, anchor)
+                    anchor = anchor + mask_f * (selected_anchor - anchor)
                     track_id = torch.where(
                         mask[:, None],
                         track_id,
-                        track_id.new_tensor(-1),
+                        torch.full_like(track_id, -1),
                     )
 
-                if i != len(self.operation_order) - 1:
+                if reencode:
                     anchor_embed = self.anchor_encoder(anchor)
-                if len(prediction) > self.num_single_frame_decoder:
+                if num_pred > self.num_single_frame_decoder:
                     temp_anchor_embed = anchor_embed[
                         :, : self.instance_bank.num_temp_instances
                     ]
@@ -285,6 +361,7 @@ class Sparse4DHead2rd(nn.Module):
         head = self.model.head
         instance_feature, anchor, cls, qt, track_id = self.head_forward(
             head,
+            self.op_plan,
             temp_instance_feature,
             temp_anchor,
             mask,
@@ -318,24 +395,37 @@ def dummpy_input(
     Return:
         dummy_level_start_index: torch.int32
     """
+    # build every dummy tensor in pinned host memory, then copy them to device
+    # asynchronously in one pass.
+    # copy_ broadcasts the parameters over batch, wherever the model lives.
     instance_feature = model.head.instance_bank.instance_feature  # (900, 256)
-    dummy_instance_feature = (
-        instance_feature[None].repeat((bs, 1, 1)).cuda()
+    dummy_instance_feature = torch.empty(
+        (bs,) + tuple(instance_feature.shape),
+        dtype=instance_feature.dtype,
+        pin_memory=True,
     )  # (bs, 900, 256)
+    dummy_instance_feature.copy_(instance_feature.detach()[None])
 
     anchor = model.head.instance_bank.anchor  # (900, 11)
-    dummy_anchor = anchor[None].repeat((bs, 1, 1)).cuda()  # (bs, 900, 11)
+    dummy_anchor = torch.empty(
+        (bs,) + tuple(anchor.shape), dtype=anchor.dtype, pin_memory=True
+    )  # (bs, 900, 11)
+    dummy_anchor.copy_(anchor.detach()[None])
 
-    dummy_temp_instance_feature = (
-        torch.zeros((bs, nums_topk, embed_dims)).float().cuda()
+    dummy_temp_instance_feature = torch.zeros(
+        (bs, nums_topk, embed_dims), dtype=torch.float32, pin_memory=True
+    )
+    dummy_temp_anchor = torch.zeros(
+        (bs, nums_topk, anchor_dims), dtype=torch.float32, pin_memory=True
+    )
+    dummy_mask = torch.randint(0, 2, size=(bs,)).bool().pin_memory()
+    dummy_track_id = torch.full(
+        (bs, nums_query), -1, dtype=torch.int32, pin_memory=True
     )
-    dummy_temp_anchor = torch.zeros((bs, nums_topk, anchor_dims)).float().cuda()
-    dummy_mask = torch.randint(0, 2, size=(bs,)).bool().cuda()
-    dummy_track_id = -1 * torch.ones((bs, nums_query)).int().cuda()
 
     dummy_time_interval = torch.tensor(
-        [model.head.instance_bank.default_time_interval] * bs
-    ).cuda()
+        [model.head.instance_bank.default_time_interval] * bs, dtype=torch.float32
+    ).pin_memory()
 
     h_4x, w_4x = input_h // 4, input_w // 4
     h_8x, w_8x = input_h // 8, input_w // 8
@@ -344,32 +434,68 @@ def dummpy_input(
     feature_size = nums_cam * (
         h_4x * w_4x + h_8x * w_8x + h_16x * w_16x + h_32x * w_32x
     )
-    dummy_feature = torch.randn(bs, feature_size, embed_dims).float().cuda()
+    dummy_feature = torch.randn(
+        bs, feature_size, embed_dims, dtype=torch.float32, pin_memory=True
+    )
 
+    spatial_shapes = torch.tensor(
+        [[h_4x, w_4x], [h_8x, w_8x], [h_16x, w_16x], [h_32x, w_32x]],
+        dtype=torch.int32,
+    )  # (4, 2)
+    # the dfa plugin reads a dense (nums_cam, 4, 2) buffer
     dummy_spatial_shapes = (
-        torch.tensor([[h_4x, w_4x], [h_8x, w_8x], [h_16x, w_16x], [h_32x, w_32x]])
-        .int()
-        .unsqueeze(0)
-        .repeat(nums_cam, 1, 1)
-        .cuda()
+        spatial_shapes.expand(nums_cam, -1, -1).contiguous().pin_memory()
     )
 
-    scale_start_index = dummy_spatial_shapes[..., 0] * dummy_spatial_shapes[..., 1]
-    scale_start_index = scale_start_index.flatten().cumsum(dim=0).int()
-    scale_start_index = torch.cat(
-        [torch.tensor([0]).to(scale_start_index), scale_start_index[:-1]]
-    )
-    dummy_level_start_index = scale_start_index.reshape(nums_cam, 4)
+    # exclusive cumsum of level areas over the flattened (nums_cam, 4) layout.
+    level_areas = (spatial_shapes[:, 0] * spatial_shapes[:, 1]).repeat(nums_cam)
+    dummy_level_start_index = torch.zeros(nums_cam * 4, dtype=torch.int32)
+    dummy_level_start_index[1:] = level_areas.cumsum(dim=0)[:-1]
+    dummy_level_start_index = dummy_level_start_index.reshape(nums_cam, 4).pin_memory()
 
-    dummy_lidar2img = torch.randn(bs, nums_cam, 4, 4).to(dummy_feature)
+    dummy_lidar2img = torch.randn(
+        bs, nums_cam, 4, 4, dtype=torch.float32, pin_memory=True
+    )
     dummy_image_wh = (
-        torch.tensor([input_w, input_h])
+        torch.tensor([input_w, input_h], dtype=torch.float32)
         .unsqueeze(0)
         .unsqueeze(0)
         .repeat(bs, nums_cam, 1)
-        .to(dummy_feature)
+        .pin_memory()
     )
 
+    (
+        dummy_instance_feature,
+        dummy_anchor,
+        dummy_time_interval,
+        dummy_feature,
+        dummy_spatial_shapes,
+        dummy_level_start_index,
+        dummy_lidar2img,
+        dummy_image_wh,
+        dummy_temp_instance_feature,
+        dummy_temp_anchor,
+        dummy_mask,
+        dummy_track_id,
+    ) = [
+        x.to("cuda", non_blocking=True)
+        for x in (
+            dummy_instance_feature,
+            dummy_anchor,
+            dummy_time_interval,
+            dummy_feature,
+            dummy_spatial_shapes,
+            dummy_level_start_index,
+            dummy_lidar2img,
+            dummy_image_wh,
+            dummy_temp_instance_feature,
+            dummy_temp_anchor,
+            dummy_mask,
+            dummy_track_id,
+        )
+    ]
+    torch.cuda.synchronize()
+
     logger.debug(f"Dummy input : hape&Type&Device Msg >>>>>>")
     roi_x = [
         "dummy_instance_feature",
@@ -415,6 +541,125 @@ def dummpy_input(
     )
 
 
+def save_onnx(onnx_model, onnx_path: str):
+    """Save onnx in a single file, or with initializers moved to
+    "<onnx_path>.data" once the model exceeds the 2GB protobuf limit.
+    """
+    if onnx_model.ByteSize() < onnx.checker.MAXIMUM_PROTOBUF:
+        onnx.save(onnx_model, onnx_path)
+    else:
+        onnx.save_model(
+            onnx_model,
+            onnx_path,
+            save_as_external_data=True,
+            all_tensors_to_one_file=True,
+            location=os.path.basename(onnx_path) + ".data",
+            size_threshold=1024,
+        )
+
+
+def ort_optimize(
+    onnx_path: str,
+    custom_op_lib: Optional[str] = None,
+    logger=logger,
+):
+    """Run onnxruntime graph optimizer at extended level and save the fused graph.
+
+    The optimized graph contains onnxruntime contrib ops (com.microsoft domain), so
+    it is saved next to onnx_path as *_opt.onnx for onnxruntime deployment only and
+    onnx_path is kept untouched for tensorrt.
+
+    Return:
+        optimized onnx path.
+    """
+    import onnxruntime as ort
+
+    opt_path = os.path.splitext(onnx_path)[0] + "_opt.onnx"
+    sess_opts = ort.SessionOptions()
+    sess_opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    sess_opts.optimized_model_filepath = opt_path
+    if custom_op_lib is not None:
+        sess_opts.register_custom_ops_library(custom_op_lib)
+    providers = [
+        x
+        for x in ["CUDAExecutionProvider", "CPUExecutionProvider"]
+        if x in ort.get_available_providers()
+    ]
+    _ = ort.InferenceSession(onnx_path, sess_options=sess_opts, providers=providers)
+    logger.info(f'🚀 ORT optimize completed. ONNX saved in "{opt_path}" 🤗.')
+    return opt_path
+
+
+def build_trt_engine(
+    onnx_path: str,
+    engine_path: str,
+    input_shapes: Dict[str, tuple],
+    max_batch: int = 1,
+    plugin_path: Optional[str] = None,
+    workspace: int = 2048,
+    logger=logger,
+):
+    """Compile onnx into a tensorrt engine with fp16 enabled.
+
+    Args:
+        input_shapes: {input_name: shape} used as opt shape of the optimization
+            profile for inputs whose shape is dynamic in the onnx graph.
+        max_batch: dynamic batch axis ranges in [1, max_batch].
+        workspace: workspace memory pool size in MiB.
+    """
+    import tensorrt as trt
+
+    trt_logger = trt.Logger(trt.Logger.INFO)
+    if plugin_path is not None:
+        ctypes.cdll.LoadLibrary(plugin_path)
+    trt.init_libnvinfer_plugins(trt_logger, "")
+
+    builder = trt.Builder(trt_logger)
+    network = builder.create_network(
+        1 << int(trt.NetworkDefinitionCreationFlag.EXPLICIT_BATCH)
+    )
+    parser = trt.OnnxParser(network, trt_logger)
+    # parse from file so that external data next to onnx_path is resolved
+    if not parser.parse_from_file(onnx_path):
+        for i in range(parser.num_errors):
+            logger.error(parser.get_error(i))
+        raise RuntimeError(f"Failed to parse onnx: {onnx_path} !")
+
+    if not builder.platform_has_fast_fp16:
+        raise RuntimeError("Platform has no fast fp16, can not build fp16 engine !")
+
+    config = builder.create_builder_config()
+    config.set_memory_pool_limit(trt.MemoryPoolType.WORKSPACE, workspace << 20)
+    config.set_flag(trt.BuilderFlag.FP16)
+
+    # DeformableAttentionAggrPlugin kernel only handles float, pin plugin layers
+    # to fp32 so tensorrt does not hand them half buffers.
+    config.set_flag(trt.BuilderFlag.OBEY_PRECISION_CONSTRAINTS)
+    for i in range(network.num_layers):
+        layer = network.get_layer(i)
+        if layer.type == trt.LayerType.PLUGIN_V2:
+            layer.precision = trt.float32
+            for j in range(layer.num_outputs):
+                layer.set_output_type(j, trt.float32)
+
+    profile = builder.create_optimization_profile()
+    for i in range(network.num_inputs):
+        tensor = network.get_input(i)
+        if tensor.shape[0] == -1:
+            opt_shape = tuple(input_shapes[tensor.name])
+            min_shape, max_shape = list(opt_shape), list(opt_shape)
+            min_shape[0], max_shape[0] = 1, max(opt_shape[0], max_batch)
+            profile.set_shape(tensor.name, min_shape, opt_shape, max_shape)
+    config.add_optimization_profile(profile)
+
+    serialized_engine = builder.build_serialized_network(network, config)
+    if serialized_engine is None:
+        raise RuntimeError(f"Failed to build engine from onnx: {onnx_path} !")
+    with open(engine_path, "wb") as f:
+        f.write(serialized_engine)
+    logger.info(f'🚀 Build engine completed. Engine saved in "{engine_path}" 🤗.')
+
+
 def build_module(cfg, default_args: Optional[Dict] = None) -> Any:
     cfg2 = cfg.copy()
     if default_args is not None:
@@ -461,7 +706,7 @@ if __name__ == "__main__":
     )
 
     if not args.osec:
-        first_frame_head = Sparse4DHead1st(copy.deepcopy(model)).cuda()
+        first_frame_head = Sparse4DHead1st(model).cuda()
         logger.info("Export Sparse4DHead1st Onnx >>>>>>>>>>>>>>>>")
         time.sleep(2)
         with torch.no_grad():
@@ -494,7 +739,11 @@ if __name__ == "__main__":
                     "class_score",
                     "quality_score",
                 ],
+                dynamic_axes=HEAD1_DYNAMIC_AXES,
                 opset_version=15,
+                export_params=True,
+                keep_initializers_as_inputs=False,
+                training=torch.onnx.TrainingMode.EVAL,
                 do_constant_folding=True,
                 verbose=False,
             )
@@ -502,12 +751,35 @@ if __name__ == "__main__":
             onnx_orig = onnx.load(args.save_onnx1)
             onnx_simp, check = simplify(onnx_orig)
             assert check, "Simplified ONNX model could not be validated"
-            onnx.save(onnx_simp, args.save_onnx1)
+            save_onnx(onnx_simp, args.save_onnx1)
             logger.info(
                 f'🚀 Export onnx completed. ONNX saved in "{args.save_onnx1}" 🤗.'
             )
 
-    head = Sparse4DHead2rd(copy.deepcopy(model)).cuda()
+        if args.ort_opt:
+            ort_optimize(args.save_onnx1, args.ort_custom_op, logger=logger)
+
+        if args.trt_fp16:
+            build_trt_engine(
+                args.save_onnx1,
+                os.path.splitext(args.save_onnx1)[0] + ".engine",
+                {
+                    "instance_feature": dummy_instance_feature.shape,
+                    "anchor": dummy_anchor.shape,
+                    "time_interval": dummy_time_interval.shape,
+                    "feature": dummy_feature.shape,
+                    "spatial_shapes": dummy_spatial_shapes.shape,
+                    "level_start_index": dummy_level_start_index.shape,
+                    "lidar2img": dummy_lidar2img.shape,
+                    "image_wh": dummy_image_wh.shape,
+                },
+                max_batch=args.trt_max_batch,
+                plugin_path=args.trt_plugin,
+                logger=logger,
+            )
+
+    # head_forward only reads the head, so both wrappers share the same model.
+    head = Sparse4DHead2rd(model).cuda()
     logger.info("Export Sparse4DHead2rd Onnx >>>>>>>>>>>>>>>>")
     time.sleep(2)
     with torch.no_grad():
@@ -549,7 +821,11 @@ if __name__ == "__main__":
                 "quality_score",
                 "track_id",
             ],
+            dynamic_axes=HEAD2_DYNAMIC_AXES,
             opset_version=15,
+            export_params=True,
+            keep_initializers_as_inputs=False,
+            training=torch.onnx.TrainingMode.EVAL,
             do_constant_folding=True,
             verbose=False,
         )
@@ -557,5 +833,31 @@ if __name__ == "__main__":
         onnx_orig = onnx.load(args.save_onnx2)
         onnx_simp, check = simplify(onnx_orig)
         assert check, "Simplified ONNX model could not be validated!"
-        onnx.save(onnx_simp, args.save_onnx2)
+        save_onnx(onnx_simp, args.save_onnx2)
         logger.info(f'🚀 Export onnx completed. ONNX saved in "{args.save_onnx2}" 🤗.')
+
+    if args.ort_opt:
+        ort_optimize(args.save_onnx2, args.ort_custom_op, logger=logger)
+
+    if args.trt_fp16:
+        build_trt_engine(
+            args.save_onnx2,
+            os.path.splitext(args.save_onnx2)[0] + ".engine",
+            {
+                "temp_instance_feature": dummy_temp_instance_feature.shape,
+                "temp_anchor": dummy_temp_anchor.shape,
+                "mask": dummy_mask.shape,
+                "track_id": dummy_track_id.shape,
+                "instance_feature": dummy_instance_feature.shape,
+                "anchor": dummy_anchor.shape,
+                "time_interval": dummy_time_interval.shape,
+                "feature": dummy_feature.shape,
+                "spatial_shapes": dummy_spatial_shapes.shape,
+                "level_start_index": dummy_level_start_index.shape,
+                "lidar2img": dummy_lidar2img.shape,
+                "image_wh": dummy_image_wh.shape,
+            },
+            max_batch=args.trt_max_batch,
+            plugin_path=args.trt_plugin,
+            logger=logger,
+        )
@@ -84,5 +84,6 @@ export ENV_HEAD1_ENGINE=trtlog/1st_frame_sparse4dhead.engine
 
 export ENV_HEAD2_ONNX=onnxlog/sparse4dhead.onnx
 export ENV_HEAD2_ENGINE=trtlog/sparse4dhead.engine
+export ENV_HEAD_MAX_BATCH=1
 
 echo "[INFO] Config Env Done, Please Check EnvPrintOut Above!"
\ No newline at end of file
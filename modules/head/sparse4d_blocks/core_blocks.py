@@ -96,7 +96,8 @@ class DeformableFeatureAggregation(BaseModule):
         anchor: torch.Tensor,
         anchor_embed: torch.Tensor,
         feature_maps: List[torch.Tensor],
-        metas: dict,
+        lidar2img: torch.Tensor,
+        image_wh: Optional[torch.Tensor] = None,
         **kwargs: dict,
     ):
         """
@@ -105,6 +106,8 @@ class DeformableFeatureAggregation(BaseModule):
             anchor: (bs, 900+x, 11) train:x=5*32*2 test=0;
             anchor_embed: (bs, 900+x, 256) train:x=5*32*2 test=0;
             feature_maps:来自图像域的特征
+            lidar2img: (bs, 6, 4, 4)
+            image_wh: (bs, 6, 2)
 
         Return:
             out: (bs, 900+x, 512)
@@ -113,14 +116,14 @@ class DeformableFeatureAggregation(BaseModule):
         # [bs, 1220, 7+6, 3]
         key_points = self.kps_generator(anchor, instance_feature)
         # [bs, 1220, 6, 4, 13, 8]
-        weights = self._get_weights(instance_feature, anchor_embed, metas)
+        weights = self._get_weights(instance_feature, anchor_embed, lidar2img)
 
         if self.use_deformable_func:
             points_2d = (
                 self.project_points(
                     key_points,
-                    metas["lidar2img"],  # lidar2img
-                    metas.get("image_wh"),
+                    lidar2img,
+                    image_wh,
                 )
                 .permute(0, 2, 3, 1, 4)
                 .reshape(bs, num_anchor, self.num_pts, self.num_cams, 2)
@@ -145,8 +148,8 @@ class DeformableFeatureAggregation(BaseModule):
             features = self.feature_sampling(
                 feature_maps,
                 key_points,
-                metas["lidar2img"],
-                metas.get("image_wh"),
+                lidar2img,
+                image_wh,
             )
             features = self.multi_view_level_fusion(features, weights)
             features = features.sum(
@@ -159,7 +162,7 @@ class DeformableFeatureAggregation(BaseModule):
             output = torch.cat([output, instance_feature], dim=-1)
         return output
 
-    def _get_weights(self, instance_feature, anchor_embed, metas=None):
+    def _get_weights(self, instance_feature, anchor_embed, lidar2img=None):
         """
         instance_feature: (bs, 900+x, 256) train:x=5*32*2 test=0;
         anchor_embed: (bs, 900+x, 256) train:x=5*32*2 test=0;
@@ -181,7 +184,7 @@ class DeformableFeatureAggregation(BaseModule):
         if self.camera_encoder is not None:
             # 对相机的外参编码： (bs,6,4,4)=>(bs,6,256)
             camera_embed = self.camera_encoder(
-                metas["lidar2img"][:, :, :3].reshape(bs, self.num_cams, -1)
+                lidar2img[:, :, :3].reshape(bs, self.num_cams, -1)
             )
             # [bs, 900+x, 1, 256] + [bs, 1, 6, 256] => (bs, 900+x, 6, 256)
             feature = feature[:, :, None] + camera_embed[:, None]
@@ -18,14 +18,15 @@ def topk(confidence, k, *inputs):
         cls     : torch.tensor, shape(bs, num_querys, 11)
     """
     bs, N = confidence.shape[:2]
+    # exported as a single onnx TopK node (opset >= 11)
     confidence, indices = torch.topk(confidence, k, dim=1)  # (bs, k), (bs, k)
-    indices = (indices + torch.arange(bs, device=indices.device)[:, None] * N).reshape(
-        -1
-    )  # (bs, k) + (k, 1) => (bs, k) => (bs*k,)
     outputs = []
-    # (bs, num_querys, c) => (bs, k, 256)
+    # (bs, num_querys, c) => (bs, k, c), gather along query dim without flattening
     for input in inputs:
-        outputs.append(input.flatten(end_dim=1)[indices].reshape(bs, k, -1))
+        input = input.reshape(bs, N, -1)
+        outputs.append(
+            torch.gather(input, 1, indices[..., None].expand(-1, -1, input.shape[-1]))
+        )
     return confidence, outputs
 
 
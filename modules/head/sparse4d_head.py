@@ -275,7 +275,8 @@ class Sparse4DHead(BaseModule):
                     anchor,  # [1, 900, 11]
                     anchor_embed,  # [1, 900, 256]
                     feature_maps,  # [[1, 89760, 256], [6, 4, 2], [6, 4, 4]]
-                    metas,
+                    metas["lidar2img"],
+                    metas.get("image_wh"),
                 )
             elif op == "refine":
                 anchor, cls, qt = self.layers[i](
@@ -1,11 +1,37 @@
 # Copyright (c) 2024 SparseEnd2End. All rights reserved @author: Thomas Von Wu.
+import os
 from itertools import chain
 from typing import List, Tuple
 
+from torch import Tensor
 from torch.nn.parallel import DataParallel
+from dataset.utils.data_container import DataContainer
 from dataset.utils.scatter_gather import ScatterInputs, scatter_kwargs
 
 
+def _to_single_device(obj: ScatterInputs, device: int) -> ScatterInputs:
+    """Equivalent of ``scatter`` onto one gpu without the per-gpu packing.
+
+    Tensors are moved to ``device`` and DataContainers are unwrapped to their
+    single per-gpu item, the rest of the input tree keeps its structure.
+    """
+    if isinstance(obj, Tensor):
+        return obj.cuda(device, non_blocking=True)
+    if isinstance(obj, DataContainer):
+        # collated containers hold a per-gpu list, a bare tensor is moved whole
+        data = obj.data[0] if isinstance(obj.data, list) else obj.data
+        if obj.cpu_only:
+            return data
+        return _to_single_device(data, device)
+    if isinstance(obj, tuple):
+        return tuple(_to_single_device(x, device) for x in obj)
+    if isinstance(obj, list):
+        return [_to_single_device(x, device) for x in obj]
+    if isinstance(obj, dict):
+        return type(obj)((k, _to_single_device(v, device)) for k, v in obj.items())
+    return obj
+
+
 class E2EDataParallel(DataParallel):
     """The DataParallel module that supports DataContainer.
 
@@ -29,11 +55,30 @@ class E2EDataParallel(DataParallel):
             Defaults to None when GPU is not available.
         output_device (str | int): Device ID for output. Defaults to None.
         dim (int): Dimension used to scatter the data. Defaults to 0.
+
+    .. note::
+        ``train_step()`` and ``val_step()`` do not check the device of module
+        parameters and buffers by default. Set the environment variable
+        ``E2E_CHECK_DEVICES=1`` to check it on every step.
     """
 
     def __init__(self, *args, dim: int = 0, **kwargs):
         super().__init__(*args, dim=dim, **kwargs)
         self.dim = dim
+        # with a single gpu, scatter only needs to move tensors onto it
+        self._single_device_fast = len(self.device_ids) == 1
+        self._check_devices_every_step = os.environ.get(
+            "E2E_CHECK_DEVICES", "0"
+        ).lower() not in ("", "0", "false")
+
+    def _check_module_device(self):
+        for t in chain(self.module.parameters(), self.module.buffers()):
+            if t.device != self.src_device_obj:
+                raise RuntimeError(
+                    "module must have its parameters and buffers "
+                    f"on device {self.src_device_obj} (device_ids[0]) but "
+                    f"found one of them on device: {t.device}"
+                )
 
     def forward(self, *inputs, **kwargs):
         """Override the original forward function.
@@ -52,6 +97,12 @@ class E2EDataParallel(DataParallel):
     def scatter(
         self, inputs: ScatterInputs, kwargs: ScatterInputs, device_ids: List[int]
     ) -> Tuple[tuple, tuple]:
+        if self._single_device_fast and device_ids == self.device_ids:
+            device = device_ids[0]
+            return (
+                (_to_single_device(tuple(inputs), device),),
+                (_to_single_device(kwargs, device),),
+            )
         return scatter_kwargs(inputs, kwargs, device_ids, dim=self.dim)
 
     def train_step(self, *inputs, **kwargs):
@@ -67,13 +118,8 @@ class E2EDataParallel(DataParallel):
             " instead."
         )
 
-        for t in chain(self.module.parameters(), self.module.buffers()):
-            if t.device != self.src_device_obj:
-                raise RuntimeError(
-                    "module must have its parameters and buffers "
-                    f"on device {self.src_device_obj} (device_ids[0]) but "
-                    f"found one of them on device: {t.device}"
-                )
+        if self._check_devices_every_step:
+            self._check_module_device()
 
         inputs, kwargs = self.scatter(inputs, kwargs, self.device_ids)
         return self.module.train_step(*inputs[0], **kwargs[0])
@@ -91,13 +137,8 @@ class E2EDataParallel(DataParallel):
             " instead."
         )
 
-        for t in chain(self.module.parameters(), self.module.buffers()):
-            if t.device != self.src_device_obj:
-                raise RuntimeError(
-                    "module must have its parameters and buffers "
-                    f"on device {self.src_device_obj} (device_ids[0]) but "
-                    f"found one of them on device: {t.device}"
-                )
+        if self._check_devices_every_step:
+            self._check_module_device()
 
         inputs, kwargs = self.scatter(inputs, kwargs, self.device_ids)
         return self.module.val_step(*inputs[0], **kwargs[0])